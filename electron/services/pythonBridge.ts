@@ -3,7 +3,7 @@
  * ======================
  * 
  * Manages Python subprocess for transcription.
- * Streams progress from stdout and returns parsed JSON result.
+ * Streams progress from stdout/stderr and returns parsed JSON result.
  */
 
 import { ChildProcess, spawn } from 'child_process';
@@ -131,14 +131,10 @@ export class PythonBridge {
       let stdoutBuffer = '';
       let stderrBuffer = '';
 
-      this.currentProcess.stdout?.on('data', (data: Buffer) => {
-        const text = data.toString();
-        stdoutBuffer += text;
-
-        // Log Python output for debugging
-        console.log(`[Python] ${text.trim()}`);
-
-        // Parse progress messages from stdout
+      // Parse progress messages from either stream: the engine logs
+      // "[TalkingCut]" status lines to stderr so stdout stays clean for
+      // JSON, but older engine versions printed them to stdout.
+      const parseProgress = (text: string) => {
         const lines = text.split('\n');
         for (const line of lines) {
           if (line.startsWith('[TalkingCut]')) {
@@ -157,13 +153,25 @@ export class PythonBridge {
             options.onProgress?.(progress, message);
           }
         }
+      };
+
+      this.currentProcess.stdout?.on('data', (data: Buffer) => {
+        const text = data.toString();
+        stdoutBuffer += text;
+
+        // Log Python output for debugging
+        console.log(`[Python] ${text.trim()}`);
+
+        parseProgress(text);
       });
 
       this.currentProcess.stderr?.on('data', (data: Buffer) => {
         const text = data.toString();
         stderrBuffer += text;
-        // Log Python errors for debugging
+        // Log Python stderr (status lines + errors) for debugging
         console.error(`[Python stderr] ${text.trim()}`);
+
+        parseProgress(text);
       });
 
       this.currentProcess.on('error', (error) => {
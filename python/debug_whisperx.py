@@ -7,18 +7,17 @@ import os
 os.environ["TORCH_FORCE_NO_WEIGHTS_ONLY_LOAD"] = "1"
 
 import sys
-import json
 import whisperx
 
-# Import our merge function
+# Import our merge function and cached model loaders
 sys.path.insert(0, os.path.dirname(__file__))
-from transcribe import reconstruct_words_from_text
+from transcribe import reconstruct_words_from_text, _get_model, _get_align_model
 
 def debug_transcribe(audio_path: str, model_size: str = "base"):
     """Debug transcription to see raw output."""
-    
+
     print(f"[DEBUG] Loading model: {model_size}")
-    model = whisperx.load_model(model_size, device="cpu", compute_type="int8")
+    model = _get_model(model_size, "cpu", "int8")
     
     print(f"[DEBUG] Loading audio: {audio_path}")
     audio = whisperx.load_audio(audio_path)
@@ -40,10 +39,7 @@ def debug_transcribe(audio_path: str, model_size: str = "base"):
     
     # Load alignment model
     print("\n[DEBUG] Loading alignment model...")
-    model_a, metadata = whisperx.load_align_model(
-        language_code=detected_language,
-        device="cpu"
-    )
+    model_a, metadata = _get_align_model(detected_language, "cpu")
     
     print("[DEBUG] Aligning...")
     aligned = whisperx.align(
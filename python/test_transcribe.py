@@ -46,6 +46,7 @@ def test_filler_word_detection():
     all_passed &= test_result("Chinese '那个'", is_filler_word("那个", "zh"))
     all_passed &= test_result("Chinese '就是'", is_filler_word("就是", "zh"))
     all_passed &= test_result("Chinese '呃'", is_filler_word("呃", "zh"))
+    all_passed &= test_result("Whitespace-padded '那个'", is_filler_word("  那个  ", "zh"))
     all_passed &= test_result("Chinese non-filler '大家好'", not is_filler_word("大家好", "zh"))
     
     return all_passed
@@ -66,28 +67,92 @@ def test_device_detection():
         f"Detected: {device}"
     )
     
-    # Test compute type mapping
+    # Test compute type mapping (quantized defaults per device)
     all_passed &= test_result("CPU compute type", get_compute_type("cpu") == "int8")
-    all_passed &= test_result("CUDA compute type", get_compute_type("cuda") == "float16")
-    all_passed &= test_result("MPS compute type", get_compute_type("mps") == "float32")
+    all_passed &= test_result("CUDA compute type", get_compute_type("cuda") == "int8_float16")
+    all_passed &= test_result("MPS compute type", get_compute_type("mps") == "float16")
+
+    # Batch sizing falls back to the fixed default off-GPU
+    from transcribe import _auto_batch_size
+    all_passed &= test_result("CPU auto batch size", _auto_batch_size("base", "cpu") == 16)
+
+    # Explicit quantization choices
+    all_passed &= test_result("CUDA int8 quant", get_compute_type("cuda", "int8") == "int8_float16")
+    all_passed &= test_result("CPU no quant", get_compute_type("cpu", "none") == "float32")
     
     return all_passed
 
 
+def test_tokenization():
+    """Test mixed CJK/Latin tokenization."""
+    print("\n🧪 Testing Mixed Text Tokenization...")
+
+    from transcribe import tokenize_mixed_text
+
+    all_passed = True
+    all_passed &= test_result(
+        "Mixed CJK/Latin",
+        tokenize_mixed_text("大家好hello world") == ["大", "家", "好", "hello", "world"])
+    all_passed &= test_result(
+        "Camel-case split",
+        tokenize_mixed_text("lightI am") == ["light", "I", "am"])
+    all_passed &= test_result(
+        "Punctuation groups",
+        tokenize_mixed_text("你好...world?!") == ["你", "好", "...", "world", "?!"])
+    all_passed &= test_result(
+        "Alphanumeric runs stay together",
+        tokenize_mixed_text("abc12def") == ["abc12def"])
+    all_passed &= test_result(
+        "Digit-led run after CJK keeps letters separate",
+        tokenize_mixed_text("你1Billion") == ["你", "1", "Billion"])
+    all_passed &= test_result(
+        "Empty input",
+        tokenize_mixed_text("") == [])
+
+    return all_passed
+
+
+def test_break_computation():
+    """Test the line-break mask computation (NumPy or Numba path)."""
+    print("\n🧪 Testing Break Computation...")
+
+    import numpy as np
+    from transcribe import _compute_breaks
+
+    # word, word-with-punct, silence(0.4s), word, long-silence(2s), word
+    is_silence = np.array([False, False, True, False, True, False])
+    durations = np.array([0.0, 0.0, 0.4, 0.0, 2.0, 0.0])
+    ends_punct = np.array([False, True, False, False, False, False])
+
+    is_last, space_candidate = _compute_breaks(is_silence, durations, ends_punct, 1.0)
+
+    all_passed = True
+    all_passed &= test_result("Plain word does not break", not is_last[0])
+    all_passed &= test_result("Punct word before silence defers break", not is_last[1])
+    all_passed &= test_result("Short silence does not break", not is_last[2])
+    all_passed &= test_result("Long silence breaks", bool(is_last[4]))
+    all_passed &= test_result("Final segment always breaks", bool(is_last[5]))
+    all_passed &= test_result("Non-breaking word gets space candidate", bool(space_candidate[0]))
+    all_passed &= test_result("Silence never gets space candidate", not space_candidate[2])
+
+    return all_passed
+
+
 def test_json_schema():
     """Test that output JSON matches expected schema."""
     print("\n🧪 Testing JSON Schema...")
     
-    # Mock segment data
-    mock_segment = {
-        "id": "test-uuid-123",
-        "text": "hello",
-        "start": 0.5,
-        "end": 1.2,
-        "confidence": 0.99,
-        "type": "word",
-        "deleted": False
-    }
+    from transcribe import Segment
+
+    # Segments materialize to the frontend schema via to_dict()
+    mock_segment = Segment(
+        id="test-uuid-123",
+        text="hello",
+        start=0.5,
+        end=1.2,
+        confidence=0.99,
+        type="word"
+    ).to_dict()
     
     all_passed = True
     
@@ -125,6 +190,8 @@ def main():
     # Run tests
     results.append(("Filler Word Detection", test_filler_word_detection()))
     results.append(("Device Detection", test_device_detection()))
+    results.append(("Mixed Text Tokenization", test_tokenization()))
+    results.append(("Break Computation", test_break_computation()))
     results.append(("JSON Schema", test_json_schema()))
     
     # Summary
@@ -15,32 +15,65 @@ This module provides word-level transcription using WhisperX, with:
 import os
 os.environ["TORCH_FORCE_NO_WEIGHTS_ONLY_LOAD"] = "1"
 
-# Selective imports to speed up initial boot feedback
+# OpenMP/MKL latch their thread counts when the pools are first built (during
+# the first torch import), so these must be set before any ML import - setting
+# them later is silently ignored. Use 80% of cores, leaving headroom for the UI.
+_THREADS = max(1, int((os.cpu_count() or 4) * 0.8))
+os.environ.setdefault("OMP_NUM_THREADS", str(_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(_THREADS))
+os.environ.setdefault("OPENBLAS_NUM_THREADS", str(_THREADS))
+os.environ.setdefault("VECLIB_MAXIMUM_THREADS", str(_THREADS))
+
+# Let the CUDA caching allocator grow segments instead of fragmenting across
+# repeated model load/unload cycles, and cap split-block size so the large
+# activation buffers the Whisper and alignment stages alternate through get
+# reused from the same arena (no-op on CPU; must be set before torch)
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:512")
+
+# Load safetensors checkpoints (alignment models) straight to GPU memory,
+# skipping the intermediate CPU copy (no-op on CPU or for non-safetensors files)
+os.environ.setdefault("SAFETENSORS_FAST_GPU", "1")
+
+# Selective imports to speed up initial boot feedback; the heavy ML imports
+# (torch, whisperx, faster_whisper, numpy) stay local to the functions that
+# need them so --help and test collection never pay the multi-second tax
 import argparse
 import json
-import os
+import logging
 import re
 import sys
-import uuid
-from pathlib import Path
+from dataclasses import dataclass
 from typing import Literal, Any
 
+# Progress/status logging. A single stderr logger replaces the former
+# per-line print() calls: stdout stays clean for JSON output (pipe-safe
+# when --output is unset), and stderr is block-buffered in pipelines
+# instead of flushing per line. The Electron bridge parses the
+# "[TalkingCut]" prefix from either stream.
+_LOG = logging.getLogger("talkingcut")
+
 # ============================================================================
 # Configuration
 # ============================================================================
 
-# Filler words for different languages
+# Filler words for different languages (frozensets: immutable, cheap lookups)
 FILLER_WORDS = {
-    "en": {
+    "en": frozenset({
         "uh", "um", "like", "you know", "basically", "actually", "literally",
         "so", "yeah", "right", "i mean", "kind of", "sort of", "well"
-    },
-    "zh": {
+    }),
+    "zh": frozenset({
         "那个", "就是", "然后", "呃", "嗯", "这个", "什么", "对", "就",
         "其实", "反正", "所以", "但是", "可能", "应该"
-    }
+    })
 }
 
+# Longest filler per language: lets is_filler_word skip the lower/strip
+# allocation for words that obviously cannot be fillers.
+_MAX_FILLER_LEN = {lang: max(len(w) for w in words)
+                   for lang, words in FILLER_WORDS.items()}
+
 # Punctuation configuration for different languages
 # Organized by category for easy maintenance and extension
 PUNCTUATION_CONFIG = {
@@ -75,27 +108,111 @@ PUNCTUATION_CONFIG = {
     },
 }
 
-def get_all_punctuation() -> set:
+def get_all_punctuation() -> frozenset:
     """Get all punctuation characters from all languages."""
     all_punct = set()
     for lang_config in PUNCTUATION_CONFIG.values():
         for category_chars in lang_config.values():
             all_punct.update(category_chars)
-    return all_punct
+    return frozenset(all_punct)
 
-# Pre-compute for performance
+# Pre-computed, frozen for performance: membership tests on a frozenset
+# hash slightly faster than on a mutable set, and freezing documents that
+# the table is never mutated after import
 ALL_PUNCTUATION = get_all_punctuation()
 
+# Sentence-final punctuation for semantic line-break protection.
+# A last-char frozenset membership test is one hash probe per word,
+# cheaper than str.endswith walking a six-entry suffix tuple.
+_SENTENCE_END = frozenset("。？！.?!")
+
 # Default minimum silence duration to mark as SILENCE segment (in seconds)
 # This is now a parameter, kept here for reference
 DEFAULT_MIN_SILENCE_DURATION = 0.5
 
+# Segment ID generation. uuid.uuid4() per segment costs a urandom read plus
+# UUID object construction and string formatting - tens of thousands of times
+# per long transcript. Instead, draw randomness in batches: one os.urandom
+# read covers _ID_POOL_BATCH ids (8 random bytes -> 16 hex chars each),
+# amortizing the syscall and skipping UUID objects entirely.
+_ID_POOL: list[str] = []
+_ID_POOL_BATCH = 256
+
+def _new_id() -> str:
+    """Return a unique random segment id (refilled from a batched urandom pool)."""
+    if not _ID_POOL:
+        raw = os.urandom(8 * _ID_POOL_BATCH)
+        _ID_POOL.extend(raw[i:i + 8].hex() for i in range(0, len(raw), 8))
+    return _ID_POOL.pop()
+
+
+def _reserve_ids(n: int) -> None:
+    """
+    Top up the ID pool to at least n entries with a single urandom read.
+
+    Called with the expected segment count before the emit loops, so a whole
+    transcription draws its randomness in one syscall instead of one refill
+    per _ID_POOL_BATCH segments.
+    """
+    deficit = n - len(_ID_POOL)
+    if deficit > 0:
+        raw = os.urandom(8 * deficit)
+        _ID_POOL.extend(raw[i:i + 8].hex() for i in range(0, len(raw), 8))
+
+# ============================================================================
+# Segment Representation
+# ============================================================================
+
+@dataclass(slots=True)
+class Segment:
+    """
+    Intermediate word/filler/silence segment.
+
+    A slotted dataclass keeps its fields in a fixed-size array instead of a
+    per-instance dict, cutting per-word memory several-fold - significant for
+    hour-long transcripts with tens of thousands of words. Segments are
+    materialized into frontend-schema dicts only at the JSON boundary.
+    """
+    id: str = ""
+    text: str = ""
+    start: float = 0.0
+    end: float = 0.0
+    confidence: float = 0.0
+    type: str = "word"
+    deleted: bool = False
+    segment_id: str = ""
+    language: str = ""
+    duration: float | None = None
+    is_last_in_segment: bool = False
+    has_trailing_space: bool = False
+    ends_with_punctuation: bool = False
+
+    def to_dict(self) -> dict:
+        """Materialize the frontend WordSegment dict."""
+        d = {
+            "id": self.id,
+            "text": self.text,
+            "start": self.start,
+            "end": self.end,
+            "confidence": self.confidence,
+            "type": self.type,
+            "deleted": self.deleted,
+        }
+        if self.type == "silence":
+            d["duration"] = self.duration
+        else:
+            d["segmentId"] = self.segment_id
+            d["language"] = self.language
+        d["isLastInSegment"] = self.is_last_in_segment
+        d["hasTrailingSpace"] = self.has_trailing_space
+        return d
+
+
 # Device detection
 def get_device() -> str:
     """Detect the best available device for inference."""
     import torch
-    import sys
-    
+
     # NOTE: As of now, WhisperX's underlying faster-whisper/ctransformers 
     # does not reliably support 'mps' (Metal Performance Shaders).
     # We default to 'cpu' on macOS for stability, which is still very fast on Apple Silicon.
@@ -107,20 +224,53 @@ def get_device() -> str:
         
     return "cpu"
 
-def get_compute_type(device: str) -> str:
-    """Get appropriate compute type for the device."""
+def get_compute_type(device: str, quant: str = "auto") -> str:
+    """
+    Get the CTranslate2 compute type for the device and quantization choice.
+
+    Quantized weights are the default everywhere: int8 on CPU (2-4x via
+    VNNI GEMMs), the mixed int8_float16 path on CUDA (INT8 weights, FP16
+    activations - halves weight bandwidth and VRAM with negligible accuracy
+    loss), float16 on MPS. Pass quant="none" to opt out (float16 on CUDA,
+    float32 elsewhere).
+    """
     if device == "cuda":
-        return "float16"
+        return "float16" if quant == "none" else "int8_float16"
+    if device == "mps":
+        return "float32" if quant == "none" else "float16"
     # For CPU (including Mac), int8 provides 2-4x speedup with minimal accuracy loss
-    return "int8"
+    return "float32" if quant == "none" else "int8"
 
 
 def get_optimal_threads() -> int:
-    """Get optimal thread count for CPU inference on Mac."""
-    import os
-    cpu_count = os.cpu_count() or 4
-    # Use 80% of cores for transcription, leaving headroom for UI
-    return max(1, int(cpu_count * 0.8))
+    """Get optimal thread count for CPU inference (80% of cores, see _THREADS)."""
+    return _THREADS
+
+
+# Rough VRAM cost per batch slot (GB) per model, used to size batches to the
+# GPU actually present instead of a one-size-fits-all constant
+_BATCH_GB_PER_SLOT = {
+    "tiny": 0.3,
+    "base": 0.5,
+    "small": 1.0,
+    "medium": 2.0,
+    "large-v3": 3.5,
+    "large-v3-turbo": 2.5,
+    "distil-large-v3": 2.0,
+}
+
+def _auto_batch_size(model_size: str, device: str) -> int:
+    """
+    Pick a batch size for the device: on CUDA, scale to free VRAM (keeping
+    ~2GB headroom for the model weights and alignment stage); elsewhere the
+    fixed default is fine since CPU batching gains little.
+    """
+    if device != "cuda":
+        return 16
+    import torch
+    free_bytes, _ = torch.cuda.mem_get_info()
+    per_slot = _BATCH_GB_PER_SLOT.get(model_size, 3.5)
+    return max(1, min(64, int((free_bytes / 1e9 - 2) / per_slot)))
 
 # ============================================================================
 # Filler Word Detection
@@ -128,37 +278,73 @@ def get_optimal_threads() -> int:
 
 def is_filler_word(text: str, language: str = "en") -> bool:
     """Check if a word/phrase is a filler word."""
-    cleaned = text.lower().strip()
-    
-    # Check in the appropriate language dictionary
-    if language.startswith("zh"):
-        return cleaned in FILLER_WORDS.get("zh", set())
-    else:
-        return cleaned in FILLER_WORDS.get("en", set())
+    key = "zh" if language.startswith("zh") else "en"
+
+    # Fast path: once stripped, anything longer than the longest known
+    # filler cannot match - skip the lowercase allocation entirely
+    cleaned = text.strip()
+    if len(cleaned) > _MAX_FILLER_LEN[key]:
+        return False
+
+    return cleaned.lower() in FILLER_WORDS[key]
+
+
+# Compiled once at import; these run per word in the hot post-processing
+# paths, and re.compile's internal cache lookup is not free
+_CJK_RE = re.compile(r'[\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af]')
 
 
 def is_latin_text(text: str) -> bool:
     """
     Check if text contains only Latin characters (no CJK).
     Used for determining word spacing in mixed-language transcripts.
+
+    One direct scan with ord-range checks replaces the former
+    re.sub + re.search pair (two regex passes plus a throwaway string
+    per call): any CJK codepoint fails immediately, and at least one
+    word character must be present (punctuation-only text is not Latin).
     """
-    # Remove punctuation for check
-    cleaned = re.sub(r'[^\w]', '', text)
-    if not cleaned:
-        return False
-    # Check if any CJK characters present
-    return not bool(re.search(r'[\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af]', cleaned))
+    has_word_char = False
+    for c in text:
+        o = ord(c)
+        if 0x4e00 <= o <= 0x9fff or 0x3040 <= o <= 0x30ff or 0xac00 <= o <= 0xd7af:
+            return False
+        if not has_word_char and (c.isalnum() or c == "_"):
+            has_word_char = True
+    return has_word_char
 
 
 def is_single_latin_char(text: str) -> bool:
     """Check if text is a single Latin character (letter only, no punctuation)."""
-    return len(text) == 1 and text.isalpha() and ord(text) < 128
+    # Plain string compares - no Unicode-category lookup needed for ASCII
+    return len(text) == 1 and ("A" <= text <= "Z" or "a" <= text <= "z")
 
 def is_punctuation(c: str) -> bool:
     """Check if character is punctuation (supports multiple languages)."""
     return c in ALL_PUNCTUATION
 
 
+# Tokenizer regexes, compiled once. A single finditer pass over the text
+# replaces the old per-character state machine (one function call plus a
+# re.match per character). Alternation order mirrors the old char-type
+# priority: CJK first, then punctuation groups, then everything else.
+# Digit-led runs match the [0-9]+ alternative so letters after them stay
+# separate alpha tokens - reconstruct_words_from_text can only match
+# aligned characters against tokens that are pure alpha, and a fused
+# token like '1Billion' would stall its matching and splatter every
+# following word back into single characters. Runs that merely contain
+# digits after a letter ('abc12def') still group as before.
+_CJK_RANGE = "\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af"
+_PUNCT_CLASS = re.escape("".join(sorted(ALL_PUNCTUATION)))
+_TOKEN_RE = re.compile(
+    f"[{_CJK_RANGE}]"          # each CJK char is its own token
+    f"|[{_PUNCT_CLASS}]+"      # consecutive punctuation grouped together
+    f"|[0-9]+"                 # digit-led runs stay separate from letters
+    f"|[^\\s{_CJK_RANGE}{_PUNCT_CLASS}]+"  # Latin/other runs
+)
+_CAMEL_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+
 def tokenize_mixed_text(text: str) -> list[str]:
     """
     Tokenize mixed CJK/Latin text by splitting on:
@@ -166,94 +352,20 @@ def tokenize_mixed_text(text: str) -> list[str]:
     2. CJK/Latin character boundaries
     3. Case transitions in Latin text (e.g., 'lightI' -> ['light', 'I'])
     4. Punctuation boundaries (consecutive punctuation grouped together)
-    
+
     Returns a list of tokens (individual CJK chars, Latin words, or punctuation groups).
     """
-    import re
-    
-    tokens = []
-    current_token = ""
-    prev_type = None  # 'cjk', 'latin_lower', 'latin_upper', 'punct', 'other'
-    
-    def get_char_type(c: str) -> str:
-        if re.match(r'[\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af]', c):
-            return 'cjk'
-        elif c.isupper() and c.isalpha():
-            return 'latin_upper'
-        elif c.islower() and c.isalpha():
-            return 'latin_lower' 
-        elif c.isspace():
-            return 'space'
-        elif is_punctuation(c):
-            return 'punct'
+    tokens: list[str] = []
+    append = tokens.append
+    extend = tokens.extend
+    for match in _TOKEN_RE.finditer(text):
+        token = match.group()
+        if len(token) > 1:
+            # Split Latin runs at lowercase-to-uppercase transitions
+            # (no-op for punctuation groups and digit runs)
+            extend(_CAMEL_RE.split(token))
         else:
-            return 'other'
-    
-    for c in text:
-        char_type = get_char_type(c)
-        
-        if char_type == 'space':
-            # Finish current token
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-            prev_type = None
-            continue
-        
-        if char_type == 'cjk':
-            # Each CJK character is its own token
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-            tokens.append(c)
-            prev_type = 'cjk'
-        elif char_type in ('latin_lower', 'latin_upper'):
-            # Check for word boundary
-            if prev_type == 'cjk' or prev_type == 'punct':
-                # Transition from CJK/punct to Latin - start new token
-                if current_token:
-                    tokens.append(current_token)
-                current_token = c
-            elif prev_type == 'latin_lower' and char_type == 'latin_upper':
-                # Lowercase to uppercase transition (e.g., 'lightI')
-                if current_token:
-                    tokens.append(current_token)
-                current_token = c
-            else:
-                current_token += c
-            prev_type = char_type
-        elif char_type == 'punct':
-            # Group consecutive punctuation together (e.g., '...' or '?!')
-            if prev_type == 'punct':
-                # Same type, append to current
-                current_token += c
-            else:
-                # Different type, start new token
-                if current_token:
-                    tokens.append(current_token)
-                current_token = c
-            prev_type = 'punct'
-        else:
-            # Other characters (numbers, etc.)
-            if prev_type == 'cjk':
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-                tokens.append(c)
-            elif prev_type == 'punct':
-                if current_token:
-                    tokens.append(current_token)
-                current_token = c
-            elif current_token:
-                current_token += c
-            else:
-                current_token = c
-            prev_type = 'other'
-    
-    # Don't forget the last token
-    if current_token:
-        tokens.append(current_token)
-    
+            append(token)
     return tokens
 
 
@@ -278,8 +390,6 @@ def reconstruct_words_from_text(words: list[dict], original_text: str) -> list[d
     if not words or not original_text:
         return words
     
-    import re
-    
     # Smart tokenization that handles mixed text
     tokens = tokenize_mixed_text(original_text)
     
@@ -291,7 +401,7 @@ def reconstruct_words_from_text(words: list[dict], original_text: str) -> list[d
             break
         
         # Check if this token is a CJK character
-        is_cjk_char = len(token) == 1 and bool(re.match(r'[\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7af]', token))
+        is_cjk_char = len(token) == 1 and _CJK_RE.match(token) is not None
         
         if is_cjk_char:
             # For CJK, match single character
@@ -306,41 +416,38 @@ def reconstruct_words_from_text(words: list[dict], original_text: str) -> list[d
                 result.append(current_word)
                 word_idx += 1
         elif token.isalpha():
-            # Latin word - collect characters
+            # Latin word - collect characters. Loop state lives in typed
+            # locals and each aligned word's .get is bound once: this inner
+            # loop runs per character of every English word in CJK audio.
             collected_chars = []
             start_time = None
             end_time = None
-            total_score = 0
-            char_count = 0
-            
-            target_chars = token.lower()
-            collected_lower = ""
-            
-            while word_idx < len(words) and len(collected_lower) < len(target_chars):
-                current_word = words[word_idx]
-                current_text = current_word.get("word", "").strip()
-                
-                if is_single_latin_char(current_text):
-                    collected_chars.append(current_text)
-                    collected_lower += current_text.lower()
-                    
-                    if start_time is None:
-                        start_time = current_word.get("start", 0)
-                    end_time = current_word.get("end", 0)
-                    total_score += current_word.get("score", 0)
-                    char_count += 1
-                    word_idx += 1
-                else:
+            total_score = 0.0
+            target_len = len(token)
+            n_words = len(words)
+
+            while word_idx < n_words and len(collected_chars) < target_len:
+                get = words[word_idx].get
+                current_text = get("word", "").strip()
+
+                if not is_single_latin_char(current_text):
                     # Not a single Latin char, stop collecting
                     break
-            
+                collected_chars.append(current_text)
+                if start_time is None:
+                    start_time = get("start", 0)
+                end_time = get("end", 0)
+                total_score += get("score", 0)
+                word_idx += 1
+
             # Create merged word
             if collected_chars:
+                char_count = len(collected_chars)
                 result.append({
                     "word": "".join(collected_chars),
                     "start": start_time or 0,
                     "end": end_time or 0,
-                    "score": total_score / char_count if char_count > 0 else 0
+                    "score": total_score / char_count
                 })
         else:
             # Punctuation group (e.g., '...') - collect matching punctuation marks
@@ -387,68 +494,126 @@ def reconstruct_words_from_text(words: list[dict], original_text: str) -> list[d
     return result
 
 
+# Lazily-compiled Numba kernel for the latin-merge group assignment (same
+# pattern as the break kernel below: None until checked, stays None without
+# numba and the pure-Python loop is used instead).
+_MERGE_KERNEL: Any = None
+_MERGE_KERNEL_CHECKED = False
+
+
+def _numba_merge_kernel() -> Any:
+    """Compile (once) and return the Numba merge kernel, or None without numba."""
+    global _MERGE_KERNEL, _MERGE_KERNEL_CHECKED
+    if not _MERGE_KERNEL_CHECKED:
+        _MERGE_KERNEL_CHECKED = True
+        try:
+            from numba import njit
+        except ImportError:
+            return None
+        import numpy as np
+
+        @njit(cache=True)
+        def kernel(is_single, starts, ends, max_gap):
+            n = is_single.shape[0]
+            group_ids = np.empty(n, np.int64)
+            gid = -1
+            chaining = False
+            prev_end = 0.0
+            for i in range(n):
+                if not is_single[i]:
+                    gid += 1
+                    chaining = False
+                elif chaining and starts[i] - prev_end <= max_gap:
+                    prev_end = ends[i]
+                else:
+                    gid += 1
+                    chaining = True
+                    prev_end = ends[i]
+                group_ids[i] = gid
+            return group_ids
+
+        _MERGE_KERNEL = kernel
+    return _MERGE_KERNEL
+
+
+def _assign_merge_groups(is_single, starts, ends, max_gap):
+    """
+    Assign each word index to a merge group: runs of single Latin characters
+    within max_gap of each other share a group; everything else is its own
+    group. Numba-compiled when available, plain loop otherwise.
+    """
+    kernel = _numba_merge_kernel()
+    if kernel is not None:
+        return kernel(is_single, starts, ends, max_gap)
+
+    import numpy as np
+
+    n = len(is_single)
+    group_ids = np.empty(n, np.int64)
+    gid = -1
+    chaining = False
+    prev_end = 0.0
+    for i in range(n):
+        if not is_single[i]:
+            gid += 1
+            chaining = False
+        elif chaining and starts[i] - prev_end <= max_gap:
+            prev_end = ends[i]
+        else:
+            gid += 1
+            chaining = True
+            prev_end = ends[i]
+        group_ids[i] = gid
+    return group_ids
+
+
 def merge_latin_characters(words: list[dict], max_gap: float = 0.3) -> list[dict]:
     """
     Simple fallback: merge consecutive single Latin characters based on time gaps.
     This is used when we don't have the original text available.
+
+    Staged as structure-of-arrays: one pre-pass extracts texts and timing
+    columns, a (Numba-accelerated) numeric pass assigns merge groups, and a
+    final pass joins each group - the nested dict-get loop is gone.
     """
     if not words:
         return words
-    
+
+    import numpy as np
+
+    n = len(words)
+    texts = [w.get("word", "").strip() for w in words]
+    is_single = np.fromiter(
+        (is_single_latin_char(t) for t in texts), dtype=bool, count=n)
+
+    # Fast path: nothing to merge
+    if not is_single.any():
+        return words
+
+    starts = np.fromiter((w.get("start", 0) for w in words), dtype=np.float64, count=n)
+    ends = np.fromiter((w.get("end", 0) for w in words), dtype=np.float64, count=n)
+    scores = np.fromiter((w.get("score", 0) for w in words), dtype=np.float64, count=n)
+
+    group_ids = _assign_merge_groups(is_single, starts, ends, max_gap)
+
     merged = []
     i = 0
-    
-    while i < len(words):
-        word = words[i]
-        word_text = word.get("word", "").strip()
-        
-        # If not a single Latin character, add as-is
-        if not is_single_latin_char(word_text):
-            merged.append(word)
-            i += 1
-            continue
-        
-        # Start collecting Latin characters
-        collected_chars = [word_text]
-        start_time = word.get("start", 0)
-        end_time = word.get("end", 0)
-        total_score = word.get("score", 0)
-        char_count = 1
-        
-        # Look ahead and collect more characters
+    while i < n:
         j = i + 1
-        while j < len(words):
-            next_word = words[j]
-            next_text = next_word.get("word", "").strip()
-            next_start = next_word.get("start", 0)
-            
-            # Check if next is also a single Latin character
-            if not is_single_latin_char(next_text):
-                break
-            
-            # Check time gap - if too large, it's a new word
-            gap = next_start - end_time
-            if gap > max_gap:
-                break
-            
-            # Add to current word
-            collected_chars.append(next_text)
-            end_time = next_word.get("end", 0)
-            total_score += next_word.get("score", 0)
-            char_count += 1
+        gid = group_ids[i]
+        while j < n and group_ids[j] == gid:
             j += 1
-        
-        # Create merged word
-        merged_text = "".join(collected_chars)
-        merged.append({
-            "word": merged_text,
-            "start": start_time,
-            "end": end_time,
-            "score": total_score / char_count if char_count > 0 else 0
-        })
-        
+        if is_single[i]:
+            merged.append({
+                "word": "".join(texts[i:j]),
+                "start": float(starts[i]),
+                "end": float(ends[j - 1]),
+                "score": float(scores[i:j].sum()) / (j - i)
+            })
+        else:
+            merged.append(words[i])
         i = j
-    
+
     return merged
 
 
@@ -459,280 +624,566 @@ def merge_latin_characters(words: list[dict], max_gap: float = 0.3) -> list[dict
 # NOTE: The previous Silero VAD-based detect_silences function has been removed.
 # Silence detection is now integrated directly into transcribe_audio() using
 # WhisperX word-level alignment timestamps. This eliminates timing offset issues
-# caused by using two independent audio analysis systems.
+# caused by using two independent audio analysis systems. It also means there
+# is no separate VAD model load or second audio decode left to run concurrently
+# with transcription - the silence pass is pure arithmetic on word timestamps.
 
 
 # ============================================================================
 # Transcription
 # ============================================================================
 
+# In-process model caches. Loading a model is multi-second disk + deserialize
+# work; keeping loaded models resident makes warm calls (batch runs, tests,
+# back-to-back files) pure inference.
+_MODEL_CACHE: dict[tuple, Any] = {}
+_ALIGN_CACHE: dict[tuple, tuple] = {}
+
+
+def _get_model(model_size: str, device: str, compute_type: str,
+               language: str | None = None, engine: str = "whisperx",
+               cpu_threads: int | None = None, num_workers: int = 1) -> Any:
+    """Load (or fetch from cache) a transcription model for the given config."""
+    key = (engine, model_size, device, compute_type, language, cpu_threads, num_workers)
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        if engine == "faster-whisper":
+            from faster_whisper import WhisperModel
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads or get_optimal_threads(),
+                num_workers=num_workers
+            )
+        else:
+            import whisperx
+            model = whisperx.load_model(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                language=language
+            )
+        _MODEL_CACHE[key] = model
+    return model
+
+
+def _get_align_model(language: str, device: str) -> tuple:
+    """Load (or fetch from cache) the alignment model for a language/device."""
+    key = (language, device)
+    cached = _ALIGN_CACHE.get(key)
+    if cached is None:
+        import whisperx
+        model_a, metadata = whisperx.load_align_model(language_code=language, device=device)
+        if device == "cpu":
+            # Same rationale as int8 Whisper weights on CPU (see
+            # get_compute_type): dynamic int8 on the Linear layers gives a
+            # 2-3x faster wav2vec2 forward with negligible accuracy loss.
+            # Quantization support varies across torch builds, so fall back
+            # to float32 on any failure.
+            import torch
+            try:
+                model_a = torch.quantization.quantize_dynamic(
+                    model_a, {torch.nn.Linear}, dtype=torch.qint8)
+            except Exception as e:
+                _LOG.info(f"int8 quantization unavailable for alignment model: {e}")
+        elif device == "cuda":
+            # The wav2vec2 alignment forward is launch-bound on GPU;
+            # torch.compile fuses its many small kernels. Compilation cost is
+            # paid once per cached model, and any backend failure (missing
+            # Triton, unsupported op) falls back to eager silently.
+            import torch
+            try:
+                model_a = torch.compile(model_a, mode="reduce-overhead", fullgraph=False)
+            except Exception as e:
+                _LOG.info(f"torch.compile unavailable for alignment model: {e}")
+        cached = (model_a, metadata)
+        _ALIGN_CACHE[key] = cached
+    return cached
+
+
+def release_models() -> None:
+    """Drop all cached models (for tests or to reclaim memory on demand)."""
+    import gc
+    _MODEL_CACHE.clear()
+    _ALIGN_CACHE.clear()
+    gc.collect()
+
+
+def _segments_from_faster_whisper(
+    audio_path: str,
+    model_size: str,
+    language: str | None,
+    device: str,
+    compute_type: str,
+    min_silence_duration: float,
+    intra_threads: int | None = None,
+    inter_threads: int = 1,
+    batch_size: int = 16
+) -> tuple[list[dict], str, float]:
+    """
+    Transcribe with faster-whisper's native word-timestamp path.
+
+    CTranslate2 int8 GEMMs make this the fastest CPU path, and the built-in
+    word timestamps mean no separate alignment model load/forward is needed.
+    The Silero VAD behind vad_filter lives inside the WhisperModel, so the
+    module-level model cache keeps it resident too - it is never reloaded
+    per call. Returns (segments, detected_language, audio_duration) where
+    segments mirror the WhisperX aligned-segment shape consumed downstream.
+    """
+    model = _get_model(model_size, device, compute_type, engine="faster-whisper",
+                       cpu_threads=intra_threads, num_workers=inter_threads)
+
+    transcribe_kwargs = dict(
+        language=language,
+        beam_size=5,
+        word_timestamps=True,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=int(min_silence_duration * 1000))
+    )
+
+    # Batch VAD-chunked segments through the encoder/decoder together -
+    # 3-4x over sequential decoding on most hardware. The pipeline wrapper
+    # shares the cached model's weights, so this costs no extra memory;
+    # fall back to sequential transcription on older faster-whisper.
+    try:
+        from faster_whisper import BatchedInferencePipeline
+        pipeline = BatchedInferencePipeline(model=model)
+        segments_iter, info = pipeline.transcribe(
+            audio_path, batch_size=batch_size, **transcribe_kwargs)
+    except ImportError:
+        segments_iter, info = model.transcribe(audio_path, **transcribe_kwargs)
+
+    segments = []
+    for i, seg in enumerate(segments_iter):
+        segments.append({
+            "id": i,
+            "text": seg.text,
+            "words": [
+                {"word": w.word, "start": w.start, "end": w.end, "score": w.probability}
+                for w in (seg.words or [])
+            ]
+        })
+
+    return segments, info.language, info.duration
+
+
+# Lazily-compiled Numba kernel for the line-break pass (None until checked;
+# stays None when numba is not installed and the NumPy fallback is used).
+_BREAK_KERNEL: Any = None
+_BREAK_KERNEL_CHECKED = False
+
+
+def _numba_break_kernel() -> Any:
+    """Compile (once) and return the Numba break kernel, or None without numba."""
+    global _BREAK_KERNEL, _BREAK_KERNEL_CHECKED
+    if not _BREAK_KERNEL_CHECKED:
+        _BREAK_KERNEL_CHECKED = True
+        try:
+            from numba import njit
+        except ImportError:
+            return None
+        import numpy as np
+
+        @njit(cache=True)
+        def kernel(is_silence, durations, ends_punct, silence_threshold):
+            n = is_silence.shape[0]
+            is_last = np.zeros(n, np.bool_)
+            space_candidate = np.zeros(n, np.bool_)
+            for i in range(n):
+                silence = is_silence[i]
+                if i == n - 1:
+                    last = True
+                elif silence:
+                    last = durations[i] >= silence_threshold
+                else:
+                    last = ends_punct[i] and not is_silence[i + 1]
+                is_last[i] = last
+                space_candidate[i] = not last and not silence
+            return is_last, space_candidate
+
+        _BREAK_KERNEL = kernel
+    return _BREAK_KERNEL
+
+
+def _compute_breaks(is_silence, durations, ends_punct, silence_threshold):
+    """
+    Compute the (is_last, space_candidate) masks for the final pass.
+
+    Silence segments break when at/above the threshold; words break on
+    sentence-final punctuation unless the following silence handles the break;
+    the final segment always breaks. Uses a Numba-compiled loop when numba is
+    installed (one tight native pass, worthwhile for very long transcripts),
+    otherwise vectorized NumPy expressions.
+    """
+    import numpy as np
+
+    kernel = _numba_break_kernel()
+    if kernel is not None:
+        return kernel(is_silence, durations, ends_punct, silence_threshold)
+
+    next_is_silence = np.zeros(len(is_silence), dtype=bool)
+    next_is_silence[:-1] = is_silence[1:]
+
+    is_last = (is_silence & (durations >= silence_threshold)) | \
+              (~is_silence & ends_punct & ~next_is_silence)
+    is_last[-1] = True
+
+    space_candidate = ~is_last & ~is_silence
+    return is_last, space_candidate
+
+
 def transcribe_audio(
     audio_path: str,
     model_size: str = "base",
     language: str | None = None,
     device: str | None = None,
-    batch_size: int = 16,
+    batch_size: int | None = None,
     silence_threshold: float = 1.0,
-    min_silence_duration: float = 0.5
+    min_silence_duration: float = 0.5,
+    engine: str = "whisperx",
+    quant: str = "auto",
+    detect_silences_enabled: bool = True,
+    intra_threads: int | None = None,
+    inter_threads: int = 1
 ) -> list[dict]:
     """
     Transcribe audio file using WhisperX with word-level alignment.
-    
+
     Args:
         audio_path: Path to the audio/video file
         model_size: Whisper model size (tiny, base, small, medium, large-v3)
         language: Language code (e.g., 'en', 'zh') or None for auto-detect
         device: Device to use (mps, cuda, cpu) or None for auto-detect
-        batch_size: Batch size for inference
+        batch_size: Batch size for inference, or None to auto-size from
+            free VRAM on CUDA (fixed default of 16 elsewhere)
         min_silence_duration: Minimum gap (in seconds) to mark as SILENCE segment (default: 0.5)
-    
+        engine: Transcription backend - "whisperx" (default) or "faster-whisper"
+            (skips the separate alignment model; fastest on CPU)
+        quant: Quantization choice passed to get_compute_type ("auto", "int8", "none")
+        detect_silences_enabled: Skip silence-segment generation when False
+        intra_threads: CTranslate2 threads per op (faster-whisper engine;
+            defaults to get_optimal_threads())
+        inter_threads: CTranslate2 parallel workers (faster-whisper engine)
+
     Returns:
         List of word segments with timing and type information
     """
     # Setup device and performance settings
+    import numpy as np
     import torch
-    import whisperx
     import time
-    import gc
-    
+
     start_time = time.time()
-    
+
     if device is None:
         device = get_device()
-    compute_type = get_compute_type(device)
+    compute_type = get_compute_type(device, quant)
+    if batch_size is None:
+        batch_size = _auto_batch_size(model_size, device)
+        _LOG.info(f"Auto-selected batch size: {batch_size}")
+    if device == "cuda":
+        # Fixed-shape wav2vec2 convs: let cuDNN autotune its algorithms once
+        torch.backends.cudnn.benchmark = True
+    # Thread pinning happens at module import (before torch) via the
+    # OMP/MKL environment variables - see the top of this file. The torch
+    # setters below take effect at runtime as well, covering the case where
+    # the pools were already latched from a different environment.
     threads = get_optimal_threads()
-    
-    # Set threading via environment variable (more reliable than kwargs)
-    os.environ["OMP_NUM_THREADS"] = str(threads)
-    os.environ["MKL_NUM_THREADS"] = str(threads)
-    
-    print(f"[TalkingCut] Using device: {device} with compute_type: {compute_type}")
-    print(f"[TalkingCut] CPU threads: {threads}")
-    print(f"[TalkingCut] Loading model: {model_size}")
-    
-    # Load WhisperX model with optimizations
-    model = whisperx.load_model(
-        model_size,
-        device=device,
-        compute_type=compute_type,
-        language=language
-    )
-    
-    load_time = time.time() - start_time
-    print(f"[TalkingCut] Model loaded in {load_time:.2f}s")
-    
-    # Load audio
-    print(f"[TalkingCut] Loading audio: {audio_path}")
-    audio = whisperx.load_audio(audio_path)
-    
-    # Transcribe with performance tracking
-    print("[TalkingCut] Transcribing...")
-    transcribe_start = time.time()
-    result = model.transcribe(audio, batch_size=batch_size)
-    transcribe_time = time.time() - transcribe_start
-    print(f"[TalkingCut] Transcription completed in {transcribe_time:.2f}s")
-    
-    # Detect language if not specified
-    detected_language = result.get("language", language or "en")
-    print(f"[TalkingCut] Detected language: {detected_language}")
-    
-    # Load alignment model with optimizations
-    print("[TalkingCut] Loading alignment model...")
-    align_load_start = time.time()
-    model_a, metadata = whisperx.load_align_model(
-        language_code=detected_language,
-        device=device
-    )
-    print(f"[TalkingCut] Alignment model loaded in {time.time() - align_load_start:.2f}s")
-    
-    # Align with performance tracking
-    print("[TalkingCut] Aligning words...")
-    align_start = time.time()
-    aligned = whisperx.align(
-        result["segments"],
-        model_a,
-        metadata,
-        audio,
-        device,
-        return_char_alignments=False
-    )
-    align_time = time.time() - align_start
-    print(f"[TalkingCut] Alignment completed in {align_time:.2f}s")
-    
-    # Post-process: reconstruct English words using original text as reference
-    # This fixes WhisperX Chinese alignment splitting English into characters
-    print("[TalkingCut] Reconstructing word boundaries...")
-    for segment in aligned.get("segments", []):
-        if "words" in segment:
-            original_text = segment.get("text", "")
-            segment["words"] = reconstruct_words_from_text(segment["words"], original_text)
+    torch.set_num_threads(threads)
+    try:
+        # Inter-op parallelism buys nothing for one sequential pipeline and
+        # its pool can only be sized before it first spins up
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
 
-    
-    # Process segments - first pass: collect all word segments
+    _LOG.info(f"Using device: {device} with compute_type: {compute_type}")
+    _LOG.info(f"CPU threads: {threads}")
+    if device == "cpu" and model_size == "large-v3":
+        _LOG.info("Hint: 'large-v3-turbo' gives similar quality with a 2-4x faster decoder on CPU")
+    _LOG.info(f"Loading model: {model_size}")
+
+    audio = None
+    audio_duration_total = None
+
+    if engine == "faster-whisper":
+        # faster-whisper emits word timestamps natively, so there is no
+        # alignment stage (and no character-split Chinese output to repair)
+        _LOG.info("Transcribing with faster-whisper...")
+        transcribe_start = time.time()
+        aligned_segments, detected_language, audio_duration_total = _segments_from_faster_whisper(
+            audio_path,
+            model_size,
+            language,
+            device,
+            compute_type,
+            min_silence_duration,
+            intra_threads=intra_threads,
+            inter_threads=inter_threads,
+            batch_size=batch_size
+        )
+        _LOG.info(f"Transcription completed in {time.time() - transcribe_start:.2f}s")
+        _LOG.info(f"Detected language: {detected_language}")
+    else:
+        import whisperx
+
+        # Load WhisperX model with optimizations (cached across calls)
+        model = _get_model(model_size, device, compute_type, language=language)
+
+        load_time = time.time() - start_time
+        _LOG.info(f"Model loaded in {load_time:.2f}s")
+
+        # Load audio
+        _LOG.info(f"Loading audio: {audio_path}")
+        audio = whisperx.load_audio(audio_path)
+
+        # Transcribe with performance tracking. Log-mel features are computed
+        # once inside model.transcribe; the wav2vec2 alignment stage consumes
+        # the raw waveform, so no mel extraction is repeated across stages.
+        _LOG.info("Transcribing...")
+        transcribe_start = time.time()
+        # Inference only: inference_mode skips autograd's version counters
+        # and view bookkeeping on every tensor the pipeline touches
+        with torch.inference_mode():
+            result = model.transcribe(audio, batch_size=batch_size)
+        transcribe_time = time.time() - transcribe_start
+        _LOG.info(f"Transcription completed in {transcribe_time:.2f}s")
+
+        # Detect language if not specified
+        detected_language = result.get("language", language or "en")
+        _LOG.info(f"Detected language: {detected_language}")
+
+        # Load alignment model with optimizations (cached across calls)
+        _LOG.info("Loading alignment model...")
+        align_load_start = time.time()
+        model_a, metadata = _get_align_model(detected_language, device)
+        _LOG.info(f"Alignment model loaded in {time.time() - align_load_start:.2f}s")
+
+        # Align with performance tracking
+        _LOG.info("Aligning words...")
+        align_start = time.time()
+        align_audio = audio
+        if device == "cuda":
+            try:
+                # Pin the host waveform so align's host->device copy runs as
+                # DMA instead of staging through pageable memory (an hour of
+                # 16kHz float32 audio is ~230MB per upload)
+                align_audio = torch.from_numpy(audio).pin_memory()
+            except RuntimeError:
+                pass
+        with torch.inference_mode():
+            aligned = whisperx.align(
+                result["segments"],
+                model_a,
+                metadata,
+                align_audio,
+                device,
+                return_char_alignments=False
+            )
+        align_time = time.time() - align_start
+        _LOG.info(f"Alignment completed in {align_time:.2f}s")
+
+        # Post-process: reconstruct English words using original text as reference.
+        # This fixes CJK alignment models splitting embedded English into
+        # characters - Latin-language alignment already emits whole words, so
+        # the common all-English path skips the O(words x chars) repair.
+        if detected_language in ("zh", "ja", "ko", "yue"):
+            _LOG.info("Reconstructing word boundaries...")
+            for segment in aligned.get("segments", []):
+                if "words" in segment:
+                    original_text = segment.get("text", "")
+                    segment["words"] = reconstruct_words_from_text(segment["words"], original_text)
+
+        aligned_segments = aligned.get("segments", [])
+
+
+    # Process segments - first pass: collect all word segments.
+    # Loop invariants (bound method, punctuation tuple) are hoisted to
+    # locals: this loop runs once per word for the whole recording.
     word_segments = []
-    
-    for segment in aligned.get("segments", []):
-        segment_id = segment.get("id", str(uuid.uuid4()))
-        words = segment.get("words", [])
-        
-        for i, word_info in enumerate(words):
+    append_word = word_segments.append
+    sentence_end = _SENTENCE_END
+
+    # One urandom read covers every id this run can need: a word id per
+    # aligned word, at most one silence per word plus the two edges, and
+    # the per-segment fallback ids
+    total_words = sum(len(s.get("words", ())) for s in aligned_segments)
+    _reserve_ids(2 * total_words + len(aligned_segments) + 2)
+
+    for segment in aligned_segments:
+        segment_id = str(segment.get("id", _new_id()))
+
+        for word_info in segment.get("words", []):
             word_text = word_info.get("word", "").strip()
             if not word_text:
                 continue
-            
-            # Determine word type
-            word_type: Literal["word", "filler", "silence"] = "word"
-            if is_filler_word(word_text, detected_language):
-                word_type = "filler"
-            
-            # Check if ends with punctuation (for semantic protection)
-            ends_with_punctuation = bool(re.search(r'[。？！.?!]$', word_text))
-            
-            word_segments.append({
-                "id": str(uuid.uuid4()),
-                "text": word_text,
-                "start": round(word_info.get("start", 0), 3),
-                "end": round(word_info.get("end", 0), 3),
-                "confidence": round(word_info.get("score", 0.0), 3),
-                "type": word_type,
-                "deleted": False,
-                "segmentId": str(segment_id),
-                "endsWithPunctuation": ends_with_punctuation,
-                # Language info for frontend
-                "language": detected_language
-            })
+
+            # Determine word type (filler words are cuttable by the UI)
+            word_type: Literal["word", "filler", "silence"] = (
+                "filler" if is_filler_word(word_text, detected_language) else "word")
+
+            # Timing fields stay unrounded here; they are rounded once,
+            # vectorized, just before the dicts are materialized
+            append_word(Segment(
+                id=_new_id(),
+                text=word_text,
+                start=word_info.get("start", 0),
+                end=word_info.get("end", 0),
+                confidence=word_info.get("score", 0.0),
+                type=word_type,
+                segment_id=segment_id,
+                language=detected_language,
+                # Ends-with-punctuation feeds semantic line-break protection
+                # (word_text is non-empty here, so [-1] is safe)
+                ends_with_punctuation=word_text[-1] in sentence_end
+            ))
 
     
-    # Second pass: calculate temporary properties for cleanup later
-    for i, word in enumerate(word_segments):
-        # We will calculate is_last and has_trailing_space in a final merged pass
-        pass
-    
-    # ===== Generate silence segments based on word gaps (no VAD) =====
-    print("[TalkingCut] Detecting silences from word gaps...")
-    import librosa
-    
-    silence_segments = []
-    
-    # 1. Detect opening silence (video start to first word)
-    if word_segments:
-        first_word_start = word_segments[0]["start"]
+    # ===== Build the final timeline with silences from word gaps (no VAD) =====
+    # Silences fall strictly between the words that bound them, so one
+    # streaming pass - opening silence, then each word followed by its
+    # qualifying gap silence, then the trailing silence - produces the
+    # timeline already sorted by start. No separate silence list, no merge.
+    if detect_silences_enabled and word_segments:
+        _LOG.info("Detecting silences from word gaps...")
+        n_words = len(word_segments)
+
+        # Vectorized gap qualification: gaps[i] is the pause after word i
+        # (zero after the last word; the trailing silence is handled below)
+        word_starts = np.fromiter(
+            (w.start for w in word_segments), dtype=np.float64, count=n_words)
+        word_ends = np.fromiter(
+            (w.end for w in word_segments), dtype=np.float64, count=n_words)
+        gaps = np.zeros(n_words)
+        gaps[:-1] = word_starts[1:] - word_ends[:-1]
+        gap_list = gaps.tolist()
+        gap_qualifies = (gaps >= min_silence_duration).tolist()
+
+        all_segments: list[Segment] = []
+        append_seg = all_segments.append
+
+        # 1. Opening silence (video start to first word)
+        first_word_start = word_segments[0].start
         if first_word_start >= min_silence_duration:
             duration = round(first_word_start, 1)
-            silence_segments.append({
-                "id": str(uuid.uuid4()),
-                "text": f"[...{duration}s]",
-                "start": 0.0,
-                "end": round(first_word_start, 3),
-                "confidence": 1.0,
-                "type": "silence",
-                "deleted": False,
-                "duration": duration,
-                "isLastInSegment": True,  # Silence causes line break
-                "hasTrailingSpace": False
-            })
-    
-    # 2. Detect inter-word silences (gaps between consecutive words)
-    for i in range(len(word_segments) - 1):
-        current_word = word_segments[i]
-        next_word = word_segments[i + 1]
-        
-        # Calculate precise word gap
-        gap = next_word["start"] - current_word["end"]
-        
-        # Only mark gaps that meet threshold
-        if gap >= min_silence_duration:
-            duration = round(gap, 1)
-            silence_segments.append({
-                "id": str(uuid.uuid4()),
-                "text": f"[...{duration}s]",
-                "start": round(current_word["end"], 3),
-                "end": round(next_word["start"], 3),
-                "confidence": 1.0,
-                "type": "silence",
-                "deleted": False,
-                "duration": duration,
-                "isLastInSegment": bool(gap >= silence_threshold),  # Silence causes line break if above threshold
-                "hasTrailingSpace": False
-            })
-    
-    # 3. Detect trailing silence (last word to audio end)
-    if word_segments:
-        audio_duration_total = librosa.get_duration(path=audio_path)
-        last_word_end = word_segments[-1]["end"]
+            append_seg(Segment(
+                id=_new_id(),
+                text=f"[...{duration}s]",
+                start=0.0,
+                end=first_word_start,
+                confidence=1.0,
+                type="silence",
+                duration=duration,
+                is_last_in_segment=True  # Silence causes line break
+            ))
+
+        # 2. Words, each followed by its inter-word silence when the gap
+        # meets the threshold
+        for i, word in enumerate(word_segments):
+            append_seg(word)
+            if gap_qualifies[i]:
+                gap = gap_list[i]
+                duration = round(gap, 1)
+                append_seg(Segment(
+                    id=_new_id(),
+                    text=f"[...{duration}s]",
+                    start=word.end,
+                    end=word_segments[i + 1].start,
+                    confidence=1.0,
+                    type="silence",
+                    duration=duration,
+                    # Silence causes line break if above threshold
+                    is_last_in_segment=bool(gap >= silence_threshold)
+                ))
+
+        # 3. Trailing silence (last word to audio end)
+        if audio_duration_total is None:
+            # whisperx.load_audio already decoded the file to 16kHz mono -
+            # derive the duration from the buffer instead of decoding again
+            audio_duration_total = len(audio) / 16000.0
+        last_word_end = word_segments[-1].end
         trailing_silence = audio_duration_total - last_word_end
-        
+
         if trailing_silence >= min_silence_duration:
             duration = round(trailing_silence, 1)
-            silence_segments.append({
-                "id": str(uuid.uuid4()),
-                "text": f"[...{duration}s]",
-                "start": round(last_word_end, 3),
-                "end": round(audio_duration_total, 3),
-                "confidence": 1.0,
-                "type": "silence",
-                "deleted": False,
-                "duration": duration,
-                "isLastInSegment": True,
-                "hasTrailingSpace": False
-            })
-    
-    # Merge and sort all segments by start time
-    all_segments = word_segments + silence_segments
-    all_segments.sort(key=lambda x: x["start"])
-
-    # Final pass: Determine line breaks and trailing spaces
-    for i in range(len(all_segments)):
-        seg = all_segments[i]
-        is_last = False
-        has_trailing_space = False
-        
-        is_final_seg = (i == len(all_segments) - 1)
-        next_seg = None if is_final_seg else all_segments[i+1]
-        
-        if seg["type"] == "silence":
-            # Silence breaks if above threshold OR if it's the very last segment
-            if seg["duration"] >= silence_threshold or is_final_seg:
-                is_last = True
-        else:
-            # It's a word
-            if is_final_seg:
-                is_last = True
-            else:
-                # Break if punctuation, but NOT if next is silence (silence will handle the break for us)
-                if seg.get("endsWithPunctuation") and (next_seg is None or next_seg["type"] != "silence"):
-                    is_last = True
-                
-                # Trailing space for Latin words if not breaking
-                if not is_last and is_latin_text(seg["text"]):
-                    has_trailing_space = True
-            
-            # Clean up temporary field
-            if "endsWithPunctuation" in seg:
-                del seg["endsWithPunctuation"]
-        
-        seg["isLastInSegment"] = is_last
-        seg["hasTrailingSpace"] = has_trailing_space
+            append_seg(Segment(
+                id=_new_id(),
+                text=f"[...{duration}s]",
+                start=last_word_end,
+                end=audio_duration_total,
+                confidence=1.0,
+                type="silence",
+                duration=duration,
+                is_last_in_segment=True
+            ))
+
+        silence_count = len(all_segments) - n_words
+    else:
+        all_segments = word_segments
+        silence_count = 0
+
+    # Final pass: Determine line breaks and trailing spaces.
+    # The gap/threshold arithmetic is vectorized with NumPy so hour-long
+    # transcripts don't pay interpreter overhead per word.
+    n = len(all_segments)
+    if n:
+        is_silence = np.fromiter(
+            (s.type == "silence" for s in all_segments), dtype=bool, count=n)
+        durations = np.fromiter(
+            (s.duration or 0.0 for s in all_segments), dtype=np.float64, count=n)
+        ends_punct = np.fromiter(
+            (s.ends_with_punctuation for s in all_segments), dtype=bool, count=n)
 
-    segments = all_segments
+        is_last, space_candidate = _compute_breaks(
+            is_silence, durations, ends_punct, silence_threshold)
+
+        # Latin-ness is combined into the trailing-space mask up front (one
+        # C-driven pass) so the assignment loop below carries no per-segment
+        # branching; silences fail the space-candidate mask regardless.
+        latin_mask = np.fromiter(
+            (is_latin_text(s.text) for s in all_segments), dtype=bool, count=n)
+        has_space = (space_candidate & latin_mask).tolist()
+        is_last = is_last.tolist()
+
+        # Round timing fields once, vectorized (tolist() converts back to
+        # Python floats in a single C pass), instead of three round() calls
+        # per segment during construction
+        starts = np.round(np.fromiter(
+            (s.start for s in all_segments), dtype=np.float64, count=n), 3).tolist()
+        ends = np.round(np.fromiter(
+            (s.end for s in all_segments), dtype=np.float64, count=n), 3).tolist()
+        confidences = np.round(np.fromiter(
+            (s.confidence for s in all_segments), dtype=np.float64, count=n), 3).tolist()
+
+        for i, seg in enumerate(all_segments):
+            seg.start = starts[i]
+            seg.end = ends[i]
+            seg.confidence = confidences[i]
+            seg.is_last_in_segment = is_last[i]
+            seg.has_trailing_space = has_space[i]
+
+    # Materialize the frontend dicts only at the JSON boundary
+    segments = [seg.to_dict() for seg in all_segments]
     
-    # Cleanup models to free memory
-    del model
-    del model_a
-    gc.collect()
+    # Models stay resident in the module caches so repeated calls warm-start;
+    # call release_models() to reclaim the memory explicitly.
     if device == "cuda":
         torch.cuda.empty_cache()
-    
+
     total_time = time.time() - start_time
-    audio_duration = len(audio) / 16000  # 16kHz sample rate
+    if audio is not None:
+        audio_duration = len(audio) / 16000  # 16kHz sample rate
+    else:
+        audio_duration = audio_duration_total or 0
     rtf = total_time / audio_duration if audio_duration > 0 else 0
     
-    print(f"[TalkingCut] Found {len(segments)} segments")
-    print(f"[TalkingCut] - Words: {len(word_segments)}")
-    print(f"[TalkingCut] - Silences: {len(silence_segments)}")
-    print(f"[TalkingCut] Total processing time: {total_time:.2f}s")
-    print(f"[TalkingCut] Real-time factor (RTF): {rtf:.2f}x")
-    print(f"[TalkingCut] Audio duration: {audio_duration:.2f}s")
+    _LOG.info(f"Found {len(segments)} segments")
+    _LOG.info(f"- Words: {len(word_segments)}")
+    _LOG.info(f"- Silences: {silence_count}")
+    _LOG.info(f"Total processing time: {total_time:.2f}s")
+    _LOG.info(f"Real-time factor (RTF): {rtf:.2f}x")
+    _LOG.info(f"Audio duration: {audio_duration:.2f}s")
     
     return segments
 
@@ -741,6 +1192,124 @@ def transcribe_audio(
 # Main Entry Point
 # ============================================================================
 
+# orjson is optional; resolve it once instead of paying the failed-import
+# cost on every segment when it is absent.
+_ORJSON: Any = None
+_ORJSON_CHECKED = False
+
+
+def _get_orjson() -> Any:
+    """Return the orjson module if installed, else None. Checked once."""
+    global _ORJSON, _ORJSON_CHECKED
+    if not _ORJSON_CHECKED:
+        _ORJSON_CHECKED = True
+        try:
+            import orjson
+            _ORJSON = orjson
+        except ImportError:
+            _ORJSON = None
+    return _ORJSON
+
+
+def _dumps_json(obj: Any, pretty: bool = True) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes.
+
+    Uses orjson (Rust implementation, 2-5x faster and no intermediate Python
+    string) when available, falling back to the stdlib encoder.
+    """
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(
+        obj, ensure_ascii=False, indent=2 if pretty else None
+    ).encode("utf-8")
+
+
+def _write_json_stream(f, segments: list[dict], metadata: dict, pretty: bool = True) -> None:
+    """
+    Stream the result document to a binary file one segment at a time.
+
+    Building the whole JSON blob in memory doubles peak RSS for long
+    transcripts (tens of MB for a 2-hour recording); writing segment by
+    segment keeps the serialization working set at one segment.
+    """
+    if pretty:
+        f.write(b'{\n  "segments": [')
+        for i, seg in enumerate(segments):
+            if i:
+                f.write(b",")
+            f.write(b"\n    " + _dumps_json(seg).replace(b"\n", b"\n    "))
+        f.write(b"\n  ]" if segments else b"]")
+        f.write(b',\n  "metadata": ')
+        f.write(_dumps_json(metadata).replace(b"\n", b"\n  "))
+        f.write(b"\n}")
+    else:
+        f.write(b'{"segments":[')
+        for i, seg in enumerate(segments):
+            if i:
+                f.write(b",")
+            f.write(_dumps_json(seg, pretty=False))
+        f.write(b'],"metadata":')
+        f.write(_dumps_json(metadata, pretty=False))
+        f.write(b"}")
+
+
+def _run_server() -> int:
+    """
+    Persistent worker loop: one JSON job per stdin line, one JSON response
+    per stdout line.
+
+    Models stay resident in the module caches between jobs, so only the
+    first job for a given configuration pays the multi-second model load -
+    every CLI invocation otherwise reloads from scratch. Job fields mirror
+    the CLI flags: {"input": ..., "output": ...?, "model": ...?,
+    "language": ...?, "device": ...?, "engine": ...?, "batch_size": ...?,
+    "quant": ...?, "no_silence": ...?}. A failing job produces an
+    {"ok": false, "error": ...} response without killing the worker.
+    """
+    _LOG.info("Server mode: reading JSON jobs from stdin")
+    out = sys.stdout.buffer
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+            model_size = job.get("model", "base")
+            segments = transcribe_audio(
+                audio_path=job["input"],
+                model_size=model_size,
+                language=job.get("language"),
+                device=job.get("device"),
+                batch_size=job.get("batch_size"),
+                engine=job.get("engine", "whisperx"),
+                quant=job.get("quant", "auto"),
+                detect_silences_enabled=not job.get("no_silence", False)
+            )
+            metadata = {
+                "model": model_size,
+                "input_file": os.path.basename(job["input"])
+            }
+            if job.get("output"):
+                with open(job["output"], "wb") as f:
+                    _write_json_stream(f, segments, metadata, pretty=False)
+                response = {"ok": True, "output": job["output"],
+                            "segment_count": len(segments)}
+            else:
+                response = {"ok": True,
+                            "result": {"segments": segments, "metadata": metadata}}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        # One compact line per job, flushed so the parent process can react
+        out.write(_dumps_json(response, pretty=False) + b"\n")
+        out.flush()
+
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="TalkingCut Transcription Engine",
@@ -749,8 +1318,7 @@ def main():
     
     parser.add_argument(
         "--input", "-i",
-        required=True,
-        help="Path to the audio/video file"
+        help="Path to the audio/video file (required unless --server)"
     )
     
     parser.add_argument(
@@ -761,8 +1329,11 @@ def main():
     parser.add_argument(
         "--model", "-m",
         default="base",
-        choices=["tiny", "base", "small", "medium", "large-v3"],
-        help="Whisper model size (default: base)"
+        choices=["tiny", "base", "small", "medium", "large-v3",
+                 "large-v3-turbo", "distil-large-v3"],
+        help="Whisper model size (default: base). 'large-v3-turbo' is "
+             "recommended for large-model quality: same encoder with ~4x "
+             "fewer decoder layers, so decoding is 2-4x faster."
     )
     
     parser.add_argument(
@@ -776,11 +1347,18 @@ def main():
         help="Device to use. Auto-detect if not specified."
     )
     
+    parser.add_argument(
+        "--engine",
+        default="whisperx",
+        choices=["whisperx", "faster-whisper"],
+        help="Transcription backend. 'faster-whisper' uses CTranslate2 int8 word "
+             "timestamps directly and skips the alignment model (fastest on CPU)."
+    )
+
     parser.add_argument(
         "--batch-size", "-b",
         type=int,
-        default=16,
-        help="Batch size for inference (default: 16)"
+        help="Batch size for inference (default: sized to free VRAM on CUDA, 16 elsewhere)"
     )
     
     parser.add_argument(
@@ -790,6 +1368,42 @@ def main():
         help="Minimum silence duration (in seconds) to mark as SILENCE segment (default: 0.5)"
     )
 
+    parser.add_argument(
+        "--intra-threads",
+        type=int,
+        help="CTranslate2 threads per op for the faster-whisper engine "
+             "(default: 80%% of cores)"
+    )
+
+    parser.add_argument(
+        "--inter-threads",
+        type=int,
+        default=1,
+        help="CTranslate2 parallel workers for the faster-whisper engine (default: 1)"
+    )
+
+    parser.add_argument(
+        "--no-silence",
+        action="store_true",
+        help="Skip silence-segment generation entirely"
+    )
+
+    parser.add_argument(
+        "--quant",
+        default="auto",
+        choices=["auto", "int8", "none"],
+        help="Weight quantization: 'auto'/'int8' use the quantized per-device "
+             "defaults (int8 on CPU, int8_float16 on CUDA - ~50%% less VRAM, "
+             "float16 on MPS), 'none' disables quantization."
+    )
+
+    parser.add_argument(
+        "--no-indent",
+        action="store_true",
+        help="Emit compact JSON (no indentation). Recommended when another "
+             "process consumes the output."
+    )
+
     parser.add_argument(
         "--offline",
         action="store_true",
@@ -800,24 +1414,43 @@ def main():
         "--mirror",
         help="Hugging Face mirror URL (e.g. https://hf-mirror.com)"
     )
-    
+
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Run as a persistent worker: one JSON job per stdin line, one "
+             "JSON response per stdout line. Models stay loaded between jobs."
+    )
+
     args = parser.parse_args()
-    
-    print("[TalkingCut] Python engine started")
+
+    # Wire the status logger to stderr (stdout is reserved for JSON output)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("[TalkingCut] %(message)s"))
+    _LOG.addHandler(handler)
+    _LOG.setLevel(logging.INFO)
+
+    _LOG.info("Python engine started")
     
     # Handle network configuration
     if args.mirror:
-        print(f"[TalkingCut] Setting HF_ENDPOINT to: {args.mirror}")
+        _LOG.info(f"Setting HF_ENDPOINT to: {args.mirror}")
         os.environ["HF_ENDPOINT"] = args.mirror
 
     if args.offline:
-        print("[TalkingCut] Forcing offline mode (HF_HUB_OFFLINE=1)")
+        _LOG.info("Forcing offline mode (HF_HUB_OFFLINE=1)")
         os.environ["HF_HUB_OFFLINE"] = "1"
         os.environ["TRANSFORMERS_OFFLINE"] = "1"
 
-    print("[TalkingCut] Loading AI libraries...")
-    
+    _LOG.info("Loading AI libraries...")
+
+    if args.server:
+        sys.exit(_run_server())
+
     # Validate input file
+    if not args.input:
+        print("Error: --input is required unless running with --server", file=sys.stderr)
+        sys.exit(1)
     if not os.path.exists(args.input):
         print(f"Error: Input file not found: {args.input}", file=sys.stderr)
         sys.exit(1)
@@ -831,26 +1464,33 @@ def main():
             device=args.device,
             batch_size=args.batch_size,
             silence_threshold=args.min_silence, # Re-using min-silence arg for silence_threshold in CLI for now, or I should rename it.
-            min_silence_duration=0.5
+            min_silence_duration=0.5,
+            engine=args.engine,
+            quant=args.quant,
+            detect_silences_enabled=not args.no_silence,
+            intra_threads=args.intra_threads,
+            inter_threads=args.inter_threads
         )
         
         # Output result
-        result = {
-            "segments": segments,
-            "metadata": {
-                "model": args.model,
-                "input_file": os.path.basename(args.input)
-            }
+        metadata = {
+            "model": args.model,
+            "input_file": os.path.basename(args.input)
         }
-        
-        output_json = json.dumps(result, ensure_ascii=False, indent=2)
-        
+
         if args.output:
-            with open(args.output, "w", encoding="utf-8") as f:
-                f.write(output_json)
-            print(f"[TalkingCut] Output written to: {args.output}")
+            # Binary mode avoids the utf-8 re-encode copy; streaming avoids
+            # materializing the whole document
+            with open(args.output, "wb") as f:
+                _write_json_stream(f, segments, metadata, pretty=not args.no_indent)
+            _LOG.info(f"Output written to: {args.output}")
         else:
-            print(output_json)
+            # Same streaming path as --output: segments go out one at a
+            # time instead of staging the whole document in memory first
+            _write_json_stream(sys.stdout.buffer, segments, metadata,
+                               pretty=not args.no_indent)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
             
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)